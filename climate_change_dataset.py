@@ -4,35 +4,22 @@
 # Dataset: Climate Change Dataset
 # =========================================
 
+import json
+import time
+from pathlib import Path
+
+import requests
 import pandas as pd
+import polars as pl
 import numpy as np
-from sklearn.linear_model import LinearRegression
 import streamlit as st
-import plotly.express as px
-import seaborn as sns
-
-sns.set(style="whitegrid")
-
-
-# Streamlit Page Config
-st.set_page_config(
-    page_title="By: Kefuoe Sole - Climate Change Dashboard",
-    layout="wide",
-    initial_sidebar_state="expanded"
-)
+import plotly.graph_objects as go
 
+from ols_kernels import ols_batch_jit
 
-# Sidebar - Profile & Filters
-st.sidebar.header("Filters")
-year_range = st.sidebar.slider(
-    "Select Year Range",
-    min_value=2000,
-    max_value=2024,
-    value=(2000, 2024)
-)
 
-st.sidebar.header("Who Am I ?")
-st.sidebar.markdown("""
+# Static page content (sidebar profile, shared CSS and top navbar), kept together for readability
+PROFILE_MARKDOWN = """
 **Names:** Mr. Kefuoe Sole  
 
 **From:** Botho University  
@@ -40,19 +27,9 @@ st.sidebar.markdown("""
 **Affiliation:**  
 - MSc Information Systems Management (Pursuing), BSc in Computing (General)  
 - CCNA, HCIA, OCI, NDE, ALX  
-""")
-
-domains = [
-    "Data Analyst", "Researcher", "Programmer", "Web Development",
-    "Software Engineering", "Cybersecurity", "Artificial Intelligence", "Cloud Computing"
-]
-selected_domain = st.sidebar.selectbox("**Domains Interested**", domains)
+"""
 
-
-
-# Custom Top Navbar
-st.markdown("""
-<link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.4.0/css/all.min.css">
+NAVBAR_CSS = """
 <style>
 .top-navbar {
     display: flex; justify-content: space-between; align-items: center; flex-wrap: wrap;
@@ -62,7 +39,7 @@ st.markdown("""
 .navbar-right { display: flex; flex-wrap: wrap; gap: 15px; }
 .navbar-right a { display: flex; align-items: center; color: black; text-decoration: none; transition: transform 0.2s, color 0.2s; }
 .navbar-right a:hover { transform: scale(1.1); color: darkblue; }
-.navbar-right i { margin-right: 6px; }
+.icon { display: inline-block; width: 1em; height: 1em; margin-right: 6px; vertical-align: -0.125em; }
 .result-box {
     background-color: #f0f8ff; padding: 15px; border-radius: 8px; border: 1px solid #a6c8ff;
     font-size: 14px; line-height: 1.6;
@@ -70,18 +47,53 @@ st.markdown("""
 .result-title { font-weight: bold; font-size: 16px; color: #003366; margin-bottom: 8px; }
 .result-year { color: #ff4500; font-weight: bold; }
 </style>
+"""
+
+NAVBAR_HTML = NAVBAR_CSS + """
 <div class="top-navbar">
     <div class="navbar-left">
-        <i class="fa fa-user"></i> Mr. Kefuoe Sole | Data Analyst / Researcher / Software Developer / Cybersecurity Consultant
+        <span class="icon">&#128100;</span> Mr. Kefuoe Sole | Data Analyst / Researcher / Software Developer / Cybersecurity Consultant
     </div>
     <div class="navbar-right">
-        <a href="https://github.com/1923k"><i class="fab fa-github"></i> GitHub</a>
-        <a href="https://www.linkedin.com/in/kefuoe-sole-0797061ba/"><i class="fab fa-linkedin"></i> LinkedIn</a>
-        <a href="mailto:soolekefuoe2@gmail.com"><i class="fas fa-envelope"></i> soolekefuoe2@gmail.com</a>
-        <a href="tel:+26650996609"><i class="fas fa-phone"></i> (+266) 50996609 / 58183915</a>
+        <a href="https://github.com/1923k"><svg class="icon" viewBox="0 0 16 16" fill="currentColor"><path d="M8 0C3.58 0 0 3.58 0 8c0 3.54 2.29 6.53 5.47 7.59.4.07.55-.17.55-.38 0-.19-.01-.82-.01-1.49-2.01.37-2.53-.49-2.69-.94-.09-.23-.48-.94-.82-1.13-.28-.15-.68-.52-.01-.53.63-.01 1.08.58 1.23.82.72 1.21 1.87.87 2.33.66.07-.52.28-.87.51-1.07-1.78-.2-3.64-.89-3.64-3.95 0-.87.31-1.59.82-2.15-.08-.2-.36-1.02.08-2.12 0 0 .67-.21 2.2.82.64-.18 1.32-.27 2-.27.68 0 1.36.09 2 .27 1.53-1.04 2.2-.82 2.2-.82.44 1.1.16 1.92.08 2.12.51.56.82 1.27.82 2.15 0 3.07-1.87 3.75-3.65 3.95.29.25.54.73.54 1.48 0 1.07-.01 1.93-.01 2.2 0 .21.15.46.55.38A8.013 8.013 0 0016 8c0-4.42-3.58-8-8-8z"/></svg> GitHub</a>
+        <a href="https://www.linkedin.com/in/kefuoe-sole-0797061ba/"><svg class="icon" viewBox="0 0 16 16"><rect width="16" height="16" rx="3" fill="#0a66c2"/><text x="2.5" y="12.5" font-size="11" font-weight="bold" font-family="Arial, sans-serif" fill="white">in</text></svg> LinkedIn</a>
+        <a href="mailto:soolekefuoe2@gmail.com"><span class="icon">&#9993;</span> soolekefuoe2@gmail.com</a>
+        <a href="tel:+26650996609"><span class="icon">&#9742;</span> (+266) 50996609 / 58183915</a>
     </div>
 </div>
-""", unsafe_allow_html=True)
+"""
+
+
+# Streamlit Page Config
+st.set_page_config(
+    page_title="By: Kefuoe Sole - Climate Change Dashboard",
+    layout="wide",
+    initial_sidebar_state="expanded"
+)
+
+
+# Sidebar - Profile & Filters
+st.sidebar.header("Filters")
+year_range = st.sidebar.slider(
+    "Select Year Range",
+    min_value=2000,
+    max_value=2024,
+    value=(2000, 2024)
+)
+
+st.sidebar.header("Who Am I ?")
+st.sidebar.markdown(PROFILE_MARKDOWN)
+
+domains = [
+    "Data Analyst", "Researcher", "Programmer", "Web Development",
+    "Software Engineering", "Cybersecurity", "Artificial Intelligence", "Cloud Computing"
+]
+selected_domain = st.sidebar.selectbox("**Domains Interested**", domains)
+
+
+
+# Custom Top Navbar
+st.markdown(NAVBAR_HTML, unsafe_allow_html=True)
 
 
 # Page Title
@@ -95,49 +107,307 @@ st.markdown(
 # Loading Dataset
 file_id = "1iT3zJQHLDVvWE3haqG36E9Fb2La59bHi"
 url = f"https://drive.google.com/uc?export=download&id={file_id}"
+parquet_path = Path(__file__).with_name("climate.parquet")
+csv_cache_path = Path("~/.cache/climate_change_dashboard/climate.csv").expanduser()
+CSV_CACHE_MAX_AGE = 24 * 3600  # seconds before the on-disk copy is revalidated
+
+essential_cols = [
+    'Year', 'Avg Temperature (°C)', 'CO2 Emissions (Tons/Capita)',
+    'Renewable Energy (%)', 'Forest Area (%)',
+    'Extreme Weather Events', 'Sea Level Rise (mm)'
+]
+essential_dtypes = {
+    'Year': pl.Int32,
+    'Avg Temperature (°C)': pl.Float32,
+    'CO2 Emissions (Tons/Capita)': pl.Float32,
+    'Renewable Energy (%)': pl.Float32,
+    'Forest Area (%)': pl.Float32,
+    'Extreme Weather Events': pl.Int32,
+    'Sea Level Rise (mm)': pl.Float32
+}
+# Same missing-value markers pandas' read_csv recognizes; Polars only treats "" as null
+csv_null_values = [
+    '', '#N/A', '#N/A N/A', '#NA', '-1.#IND', '-1.#QNAN', '-NaN', '-nan',
+    '1.#IND', '1.#QNAN', '<NA>', 'N/A', 'NA', 'NULL', 'NaN', 'None',
+    'n/a', 'nan', 'null'
+]
+
+
+# Sidecar file holding the ETag/Last-Modified of a cached download
+def _dataset_meta_path(local_path):
+    return local_path.with_name(local_path.name + ".meta.json")
+
 
+# Remove a cached download (and its metadata) so the next load fetches it again
+def discard_dataset(local_path):
+    local_path = Path(local_path)
+    try:
+        local_path.unlink(missing_ok=True)
+        _dataset_meta_path(local_path).unlink(missing_ok=True)
+    except OSError:
+        pass
+
+
+# Download url to local_path once and reuse it across restarts. A copy older than
+# CSV_CACHE_MAX_AGE is revalidated with its stored ETag/Last-Modified, and a stale copy
+# is still used if Google Drive can't be reached or doesn't return the CSV.
+def fetch_dataset(url, local_path):
+    local_path = Path(local_path)
+    meta_path = _dataset_meta_path(local_path)
+    if local_path.exists() and time.time() - local_path.stat().st_mtime < CSV_CACHE_MAX_AGE:
+        return local_path
+
+    headers = {}
+    if local_path.exists() and meta_path.exists():
+        try:
+            meta = json.loads(meta_path.read_text())
+        except (OSError, ValueError):
+            meta = {}
+        if not isinstance(meta, dict):
+            meta = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+
+    try:
+        with requests.get(url, headers=headers, stream=True, timeout=30) as resp:
+            if resp.status_code == 304:
+                local_path.touch()
+                return local_path
+            resp.raise_for_status()
+            # Google Drive answers quota/confirmation pages with 200 and an HTML body
+            if "html" in resp.headers.get("Content-Type", "").lower():
+                raise requests.exceptions.RequestException(
+                    "Google Drive returned an HTML page instead of the CSV file"
+                )
+            local_path.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = local_path.with_name(local_path.name + ".part")
+            with open(tmp_path, "wb") as f:
+                for chunk in resp.iter_content(chunk_size=1 << 20):
+                    f.write(chunk)
+            with open(tmp_path, "r", encoding="utf-8", errors="replace") as f:
+                header = f.readline()
+            if not all(col in header for col in essential_cols):
+                tmp_path.unlink(missing_ok=True)
+                raise requests.exceptions.RequestException(
+                    "Downloaded file does not have the expected CSV header"
+                )
+            tmp_path.replace(local_path)
+            meta_path.write_text(json.dumps({
+                "etag": resp.headers.get("ETag"),
+                "last_modified": resp.headers.get("Last-Modified")
+            }))
+    except requests.exceptions.RequestException:
+        if not local_path.exists():
+            raise
+    return local_path
+
+
+# Load, clean and sort once; cached across reruns so slider changes don't re-download.
+# Prefers the local Parquet copy (see convert_to_parquet.py) and falls back to the CSV,
+# fetched into the on-disk cache by fetch_dataset, or read from the URL when that cache
+# can't be written.
+# Projection, null drop, cast and sort run as one Polars plan; only the result is
+# converted to pandas so everything downstream stays unchanged.
+# Returns (df, data_version), where data_version fingerprints the loaded rows (row count
+# plus a content hash) and keys every downstream cache, so a refreshed load never mixes
+# with arrays, fits or figures built from the previous one.
+@st.cache_data(ttl=3600)
+def load_climate_df(url, parquet_path=None, csv_path=None):
+    cached_csv = None
+    if parquet_path is not None and Path(parquet_path).exists():
+        lazy = pl.scan_parquet(parquet_path)
+    else:
+        if csv_path is not None:
+            try:
+                cached_csv = fetch_dataset(url, csv_path)
+            except requests.exceptions.RequestException:
+                raise
+            except OSError:
+                # On-disk cache not writable (e.g. read-only home); read the URL directly
+                cached_csv = None
+        if cached_csv is not None:
+            lazy = pl.scan_csv(cached_csv, schema_overrides=essential_dtypes, null_values=csv_null_values)
+        else:
+            lazy = pl.read_csv(
+                url, columns=essential_cols, schema_overrides=essential_dtypes, null_values=csv_null_values
+            ).lazy()
+    # fill_nan turns float NaN (e.g. from Parquet) into null so drop_nulls removes those rows too
+    try:
+        df = (
+            lazy.select(essential_cols)
+            .fill_nan(None)
+            .drop_nulls()
+            .cast(essential_dtypes)
+            .sort('Year')
+            .collect()
+            .to_pandas()
+        )
+    except pl.exceptions.PolarsError:
+        # Don't keep serving a cached download that can't be parsed
+        if cached_csv is not None:
+            discard_dataset(cached_csv)
+        raise
+    row_hash = pd.util.hash_pandas_object(df, index=False).to_numpy().sum()
+    return df, (len(df), int(row_hash))
+
+
+data_version = None
 try:
-    df = pd.read_csv(url)
+    df, data_version = load_climate_df(url, str(parquet_path), str(csv_cache_path))
     st.success("Dataset loaded successfully!")
+    st.success("Dataset cleaned and sorted by Year successfully!")
 except FileNotFoundError:
     st.error("File not found. Please check the Google Drive file ID or link.")
     df = pd.DataFrame()
-except pd.errors.EmptyDataError:
+except requests.exceptions.RequestException as err:
+    st.error(f"Could not download the dataset from Google Drive: {err}")
+    df = pd.DataFrame()
+except pl.exceptions.NoDataError:
     st.error("The file is empty. Please check your dataset.")
     df = pd.DataFrame()
-except pd.errors.ParserError:
+except pl.exceptions.ColumnNotFoundError as ke:
+    st.error(f"Dataset is missing expected column: {ke}")
+    df = pd.DataFrame()
+except pl.exceptions.ComputeError:
     st.error("Error parsing the CSV file. Ensure it is properly formatted.")
     df = pd.DataFrame()
+except KeyError as ke:
+    st.error(f"Dataset is missing expected column: {ke}")
+    df = pd.DataFrame()
 except Exception as e:
     st.error(f"An unexpected error occurred while loading the dataset: {e}")
     df = pd.DataFrame()
 
+if df.empty:
+    st.warning("No dataset available to clean or sort.")
 
-# Clean and Prepare Dataset
-if not df.empty:
-    try:
-        df['Year'] = pd.to_numeric(df['Year'], errors='coerce')
-        essential_cols = [
-            'Year', 'Avg Temperature (°C)', 'CO2 Emissions (Tons/Capita)',
-            'Renewable Energy (%)', 'Forest Area (%)',
-            'Extreme Weather Events', 'Sea Level Rise (mm)'
-        ]
-        df = df.dropna(subset=essential_cols)
-        df['Year'] = df['Year'].astype(int)
-        df = df.sort_values(by='Year').reset_index(drop=True)
-        st.success("Dataset cleaned and sorted by Year successfully!")
-    except KeyError as ke:
-        st.error(f"Dataset is missing expected column: {ke}")
-        df = pd.DataFrame()
-    except Exception as e:
-        st.error(f"An error occurred during dataset cleaning: {e}")
-        df = pd.DataFrame()
+
+# Below this many rows the NumPy closed form is faster than calling the compiled kernel
+JIT_MIN_ROWS = 1_000_000
+
+
+# Closed-form simple linear regression of each column of Y on the matching column of X;
+# returns (slopes, intercepts, rs) of Y[:, j] = intercepts[j] + slopes[j] * X[:, j], with
+# rs[j] the Pearson correlation taken from the same centered sums
+def ols_batch(X, Y):
+    X = np.asarray(X, dtype=np.float64)
+    Y = np.asarray(Y, dtype=np.float64)
+    if ols_batch_jit is not None and X.shape[0] >= JIT_MIN_ROWS:
+        return ols_batch_jit(np.ascontiguousarray(X), np.ascontiguousarray(Y))
+    xm = X.mean(axis=0)
+    ym = Y.mean(axis=0)
+    Xc = X - xm
+    Yc = Y - ym
+    sxx = (Xc ** 2).sum(axis=0)
+    syy = (Yc ** 2).sum(axis=0)
+    sxy = (Xc * Yc).sum(axis=0)
+    slopes = np.divide(sxy, sxx, out=np.zeros_like(sxy), where=sxx != 0)
+    sxx_syy = sxx * syy
+    rs = np.divide(sxy, np.sqrt(sxx_syy), out=np.zeros_like(sxy), where=sxx_syy != 0)
+    return slopes, ym - slopes * xm, rs
+
+
+# (x_col, y_col) of every trendline on the dashboard, fitted together in one pass
+trend_pairs = [
+    ('Year', 'Avg Temperature (°C)'),
+    ('CO2 Emissions (Tons/Capita)', 'Avg Temperature (°C)'),
+    ('Year', 'Sea Level Rise (mm)'),
+    ('CO2 Emissions (Tons/Capita)', 'Extreme Weather Events'),
+    ('Renewable Energy (%)', 'CO2 Emissions (Tons/Capita)'),
+    ('Forest Area (%)', 'CO2 Emissions (Tons/Capita)')
+]
+
+
+# Fit all trendlines for the current selection; returns {(x_col, y_col): (slope, intercept, r)}.
+# Held as a shared object keyed on the selected row bounds, so each selection is fitted once
+# per process and year ranges covering the same rows reuse the same fits.
+@st.cache_resource(ttl=3600)
+def fit_trendlines(_filtered, data_key):
+    X = np.column_stack([_filtered[x_col] for x_col, _ in trend_pairs])
+    Y = np.column_stack([_filtered[y_col] for _, y_col in trend_pairs])
+    slopes, intercepts, rs = ols_batch(X, Y)
+    return {
+        pair: (float(b), float(a), float(r))
+        for pair, b, a, r in zip(trend_pairs, slopes, intercepts, rs)
+    }
+
+
+# Per-year mean and sample std of values; years must be sorted
+def yearly_mean_std(years, values):
+    uniq, starts = np.unique(years, return_index=True)
+    counts = np.diff(np.append(starts, years.size))
+    means = np.add.reduceat(values, starts) / counts
+    sq_dev = np.add.reduceat((values - np.repeat(means, counts)) ** 2, starts)
+    stds = np.sqrt(sq_dev / np.maximum(counts - 1, 1))
+    return uniq, means, stds
+
+
+# Max markers sent to the browser per scatter; larger selections are evenly strided
+MAX_SCATTER_POINTS = 5000
+
+# Layout shared by every chart; per-chart title and axis labels are merged in
+BASE_LAYOUT = dict(showlegend=False, hovermode='closest')
+
+
+# Build a chart and its summary stats; cached on (data_key, columns, title, fit) so reruns that
+# don't change the year range (profile edits, domain dropdown) skip figure construction.
+# _filtered is excluded from hashing - data_key must identify it, e.g. (data_version, year_range).
+# Year-based charts plot per-year mean ± std; stats and trendline always use every row.
+# Every trace is WebGL (Scattergl) so the browser rasterizes on the GPU rather than in SVG.
+@st.cache_data(ttl=3600)
+def build_trendline_fig(_filtered, data_key, x_col, y_col, chart_title, slope, intercept):
+    x = _filtered[x_col]
+    y = _filtered[y_col]
+    hovertemplate = f"{x_col}=%{{x}}<br>{y_col}=%{{y}}<extra></extra>"
+    if x_col == 'Year':
+        years, means, stds = yearly_mean_std(x, y)
+        points = go.Scattergl(
+            x=years, y=means, error_y=dict(array=stds), mode='lines+markers',
+            hovertemplate=hovertemplate
+        )
+    else:
+        step = max(1, int(np.ceil(x.size / MAX_SCATTER_POINTS)))
+        points = go.Scattergl(x=x[::step], y=y[::step], mode='markers', hovertemplate=hovertemplate)
+    xline = np.array([x.min(), x.max()], dtype=np.float64)
+    trendline = go.Scattergl(
+        x=xline, y=intercept + slope * xline, mode='lines', name='ols',
+        hovertemplate=f"y = {slope:.4f}x + {intercept:.2f}<extra>OLS trendline</extra>"
+    )
+    layout = dict(BASE_LAYOUT, title=chart_title, xaxis=dict(title=x_col), yaxis=dict(title=y_col))
+    fig = go.Figure(data=[points, trendline], layout=layout)
+    min_val = y.min()
+    max_val = y.max()
+    mean_val = y.mean()
+    return fig.to_dict(), min_val, max_val, mean_val
+
+
+# Column arrays built once per dataset and reused by every chart and metric
+@st.cache_resource(ttl=3600)
+def build_column_arrays(_df, data_key):
+    arrays = {c: _df[c].to_numpy(dtype=np.float64) for c in essential_cols}
+    arrays['Year'] = _df['Year'].to_numpy(dtype=np.int64)
+    return arrays
+
+
+# Year is sorted, so a year range is a contiguous slice found by binary search
+def year_slice(year_arr, year_range):
+    lo = np.searchsorted(year_arr, year_range[0], side='left')
+    hi = np.searchsorted(year_arr, year_range[1], side='right')
+    return slice(lo, hi)
+
+
+if df.empty:
+    arrays = {c: np.empty(0) for c in essential_cols}
 else:
-    st.warning("No dataset available to clean or sort.")
+    arrays = build_column_arrays(df, data_version)
+rows = year_slice(arrays['Year'], year_range)
+filtered = {c: arr[rows] for c, arr in arrays.items()}
 
 
-# Filter by Year Range
-df_filtered = df[(df['Year'] >= year_range[0]) & (df['Year'] <= year_range[1])]
+# Filter by Year Range (positional slice of the sorted frame, no boolean mask)
+df_filtered = df.iloc[rows]
 
 if df_filtered.empty:
     st.warning("No data available for the selected year range. Please adjust the slider.")
@@ -146,22 +416,21 @@ else:
     # Key Metrics
     st.subheader("Key Metrics")
     col1, col2, col3 = st.columns(3)
-    col1.metric("Avg Temperature (°C)", f"{df_filtered['Avg Temperature (°C)'].mean():.2f}")
-    col2.metric("Avg CO2 Emissions (Tons/Capita)", f"{df_filtered['CO2 Emissions (Tons/Capita)'].mean():.2f}")
-    col3.metric("Avg Extreme Weather Events", f"{df_filtered['Extreme Weather Events'].mean():.2f}")
+    col1.metric("Avg Temperature (°C)", f"{filtered['Avg Temperature (°C)'].mean():.2f}")
+    col2.metric("Avg CO2 Emissions (Tons/Capita)", f"{filtered['CO2 Emissions (Tons/Capita)'].mean():.2f}")
+    col3.metric("Avg Extreme Weather Events", f"{filtered['Extreme Weather Events'].mean():.2f}")
+
+    trend_fits = fit_trendlines(filtered, (data_version, rows.start, rows.stop))
 
   
     # Function to Display Chart with Trendline & Results
     def display_chart_with_trendline(x_col, y_col, chart_title, y_label=None):
         y_label = y_label or y_col
-        fig = px.scatter(df_filtered, x=x_col, y=y_col, trendline="ols", hover_data={x_col: True, y_col: True})
-        results = px.get_trendline_results(fig)
-        slope = results.iloc[0]["px_fit_results"].params[1]
-        intercept = results.iloc[0]["px_fit_results"].params[0]
-        min_val = df_filtered[y_col].min()
-        max_val = df_filtered[y_col].max()
-        mean_val = df_filtered[y_col].mean()
-        fig.update_layout(title=chart_title)
+        slope, intercept, r = trend_fits[(x_col, y_col)]
+        fig_dict, min_val, max_val, mean_val = build_trendline_fig(
+            filtered, (data_version, year_range), x_col, y_col, chart_title, slope, intercept
+        )
+        fig = go.Figure(fig_dict)
 
         # Display chart and trendline info
         col_chart, col_info = st.columns([3, 1])
@@ -173,36 +442,37 @@ else:
         <b>Trendline:</b> y = {slope:.4f}x + {intercept:.2f}<br>
         <b>Slope:</b> {slope:.4f}<br>
         <b>Intercept:</b> {intercept:.2f}<br>
+        <b>Correlation (r):</b> {r:.4f}<br>
         <b>Min {y_label}:</b> {min_val:.2f}<br>
         <b>Max {y_label}:</b> {max_val:.2f}<br>
         <b>Mean {y_label}:</b> {mean_val:.2f}
         </div>
         """, unsafe_allow_html=True)
 
-        return slope
+        return slope, intercept
 
 
     # Result 1: Global Temperature Trend
     st.subheader("Result 1: Global Average Temperature Trend")
-    slope_temp = display_chart_with_trendline('Year', 'Avg Temperature (°C)', 'Global Average Temperature Trend', 'Temperature (°C)')
+    slope_temp, _ = display_chart_with_trendline('Year', 'Avg Temperature (°C)', 'Global Average Temperature Trend', 'Temperature (°C)')
 
 
     # Result 2: CO2 vs Temperature
     st.subheader("Result 2: CO2 Emissions vs Avg Temperature")
-    slope_co2 = display_chart_with_trendline('CO2 Emissions (Tons/Capita)', 'Avg Temperature (°C)', 'CO2 Emissions vs Avg Temperature')
+    slope_co2, _ = display_chart_with_trendline('CO2 Emissions (Tons/Capita)', 'Avg Temperature (°C)', 'CO2 Emissions vs Avg Temperature')
 
   
     # Result 3: Sea Level Rise
     st.subheader("Result 3: Sea Level Rise Over Time")
-    slope_sea = display_chart_with_trendline('Year', 'Sea Level Rise (mm)', 'Sea Level Rise Over Time', 'Sea Level (mm)')
+    slope_sea, _ = display_chart_with_trendline('Year', 'Sea Level Rise (mm)', 'Sea Level Rise Over Time', 'Sea Level (mm)')
 
 
     # Result 4: Extreme Weather vs CO2
     st.subheader("Result 4: Extreme Weather Events vs CO2 Emissions")
-    slope_extreme = display_chart_with_trendline('CO2 Emissions (Tons/Capita)', 'Extreme Weather Events', 'Extreme Weather Events vs CO2 Emissions')
+    slope_extreme, _ = display_chart_with_trendline('CO2 Emissions (Tons/Capita)', 'Extreme Weather Events', 'Extreme Weather Events vs CO2 Emissions')
 
    
     # Result 5: Renewable Energy & Forest Area vs CO2
     st.subheader("Result 5: Renewable Energy & Forest Area vs CO2 Emissions")
-    slope_renew = display_chart_with_trendline('Renewable Energy (%)', 'CO2 Emissions (Tons/Capita)', 'Renewable Energy vs CO2 Emissions')
-    slope_forest = display_chart_with_trendline('Forest Area (%)', 'CO2 Emissions (Tons/Capita)', 'Forest Area vs CO2 Emissions')
+    slope_renew, _ = display_chart_with_trendline('Renewable Energy (%)', 'CO2 Emissions (Tons/Capita)', 'Renewable Energy vs CO2 Emissions')
+    slope_forest, _ = display_chart_with_trendline('Forest Area (%)', 'CO2 Emissions (Tons/Capita)', 'Forest Area vs CO2 Emissions')
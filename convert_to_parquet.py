@@ -0,0 +1,20 @@
+# =========================================
+# One-shot conversion of the Climate Change Dataset to Parquet
+# Usage: python convert_to_parquet.py
+# Writes climate.parquet next to the dashboard, which is then loaded
+# instead of re-downloading and re-parsing the CSV.
+# =========================================
+
+from pathlib import Path
+
+import pandas as pd
+
+file_id = "1iT3zJQHLDVvWE3haqG36E9Fb2La59bHi"
+url = f"https://drive.google.com/uc?export=download&id={file_id}"
+parquet_path = Path(__file__).with_name("climate.parquet")
+
+
+if __name__ == "__main__":
+    df = pd.read_csv(url)
+    df.to_parquet(parquet_path, compression="zstd", engine="pyarrow", index=False)
+    print(f"Wrote {len(df)} rows to {parquet_path}")
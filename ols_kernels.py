@@ -0,0 +1,52 @@
+# =========================================
+# Compiled OLS kernel for the Climate Change Dashboard
+# Kept in its own module so Python's import cache holds the numba Dispatcher for the
+# whole server process; the dashboard script itself is re-executed on every rerun.
+# =========================================
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+
+# Fused single-pass OLS kernel: accumulates shifted sums per column instead of
+# materializing centered temporaries. Serial on purpose - Streamlit runs sessions in
+# parallel threads, and numba's default workqueue threading layer is not thread-safe.
+# Compiled lazily (and cached on disk) the first time it's called.
+if njit is not None:
+    @njit(fastmath=True, cache=True)
+    def ols_batch_jit(X, Y):
+        n, k = X.shape
+        slopes = np.zeros(k)
+        intercepts = np.empty(k)
+        rs = np.zeros(k)
+        for j in range(k):
+            x0 = X[0, j]
+            y0 = Y[0, j]
+            sx = 0.0
+            sy = 0.0
+            sxx = 0.0
+            syy = 0.0
+            sxy = 0.0
+            for i in range(n):
+                dx = X[i, j] - x0
+                dy = Y[i, j] - y0
+                sx += dx
+                sy += dy
+                sxx += dx * dx
+                syy += dy * dy
+                sxy += dx * dy
+            cxx = sxx - sx * sx / n
+            cyy = syy - sy * sy / n
+            cxy = sxy - sx * sy / n
+            if cxx > 0:
+                slopes[j] = cxy / cxx
+                if cyy > 0:
+                    rs[j] = cxy / np.sqrt(cxx * cyy)
+            intercepts[j] = (y0 + sy / n) - slopes[j] * (x0 + sx / n)
+        return slopes, intercepts, rs
+else:
+    ols_batch_jit = None